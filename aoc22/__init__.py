@@ -0,0 +1 @@
+"""Shared tooling for running and timing the day_N solutions."""
@@ -0,0 +1,179 @@
+"""Benchmark every day on generated inputs at growing scales.
+
+Records time and peak memory per day, part and scale to a JSON baseline,
+and compares a run against a saved baseline.
+"""
+import argparse
+import hashlib
+import inspect
+import json
+import math
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from aoc22.days import ROOT, day_numbers
+from aoc22.generators import GENERATORS, generate
+from aoc22.runner import PARTS, Options, format_timing, run_file
+
+INPUTS = ROOT / ".bench"
+SCALES = (10, 100, 1000)
+
+Record = dict[str, Any]
+
+
+def generator_hash(day: int) -> str:
+    source = inspect.getsource(GENERATORS[day])
+    return hashlib.sha256(source.encode()).hexdigest()[:12]
+
+
+def bench_input(day: int, scale: int, seed: int) -> Path:
+    # editing a generator changes the name, so stale inputs are never reused
+    path = INPUTS / f"day_{day}_{generator_hash(day)}_s{seed}_x{scale}.txt"
+    if not path.exists():
+        INPUTS.mkdir(exist_ok=True)
+        path.write_text(generate(day, scale, seed))
+    return path
+
+
+def peak_memory(day: int, part: int, path: Path, options: Options) -> int:
+    tracemalloc.start()
+    try:
+        run_file(day, part, path, options=options)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def bench_key(day: int, part: int, scale: int) -> str:
+    return f"day_{day}.part_{part}.x{scale}"
+
+
+def growth(records: list[tuple[int, Record]]) -> float | None:
+    if len(records) < 2:
+        return None
+    (a, ra), (b, rb) = records[-2:]
+    if ra["total"] <= 0 or rb["total"] <= 0:
+        return None
+    return math.log(rb["total"] / ra["total"]) / math.log(b / a)
+
+
+def bench_day(
+    day: int, part: int, scales: list[int], args: argparse.Namespace
+) -> dict[str, Record]:
+    results: dict[str, Record] = {}
+    done: list[tuple[int, Record]] = []
+    options = Options(stream=args.stream, backend=args.backend)
+    for scale in scales:
+        label = f"day {day:>2} part {part} x{scale:<5}"
+        if done and done[-1][1]["total"] > args.budget:
+            print(f"{label} skipped, x{done[-1][0]} went over the {args.budget}s budget")
+            continue
+
+        path = bench_input(day, scale, args.seed)
+        result = run_file(day, part, path, options=options)
+        t = result.timing
+        record: Record = {
+            "read": t.read,
+            "parse": t.parse,
+            "solve": t.solve,
+            "total": t.total,
+            "answer": str(result.answer),
+        }
+        if args.memory:
+            record["peak_memory"] = peak_memory(day, part, path, options)
+
+        done.append((scale, record))
+        results[bench_key(day, part, scale)] = record
+
+        line = f"{label} {format_timing(t)}"
+        if "peak_memory" in record:
+            line += f"  peak {record['peak_memory'] / 2**20:9.2f}MiB"
+        slope = growth(done)
+        if slope is not None:
+            line += f"  growth n^{slope:.2f}"
+        print(line)
+
+    return results
+
+
+def compare(
+    results: dict[str, Record], baseline: dict[str, Record], threshold: float
+) -> list[str]:
+    regressions = []
+    for key, record in results.items():
+        if key not in baseline:
+            continue
+        base = baseline[key]
+        ratio = record["total"] / base["total"] if base["total"] else math.inf
+        line = f"{key:<22} time x{ratio:6.2f}"
+        if "peak_memory" in record and base.get("peak_memory"):
+            mem_ratio = record["peak_memory"] / base["peak_memory"]
+            line += f"  memory x{mem_ratio:6.2f}"
+            ratio = max(ratio, mem_ratio)
+        if record["answer"] != base["answer"]:
+            line += f"  answer {base['answer']} -> {record['answer']}"
+            ratio = math.inf
+        if ratio > threshold:
+            line += "  REGRESSION"
+            regressions.append(key)
+        print(line)
+    return regressions
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m aoc22.bench", description=__doc__)
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("-p", "--part", nargs="+", type=int, choices=PARTS)
+    parser.add_argument("-s", "--scale", nargs="+", type=int, default=list(SCALES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=30.0,
+        help="skip larger scales once a run takes longer than this many seconds",
+    )
+    parser.add_argument(
+        "--backend", help="parse with this backend on the days that have one"
+    )
+    parser.add_argument(
+        "--stream", action="store_true", help="stream inputs through the day's hooks"
+    )
+    parser.add_argument("--no-memory", dest="memory", action="store_false")
+    parser.add_argument("--save", type=Path, help="write the results to this file")
+    parser.add_argument("--compare", type=Path, help="compare against this baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="slowdown ratio that counts as a regression",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> None:
+    args = parse_args(argv)
+    days = args.days or [d for d in day_numbers() if d in GENERATORS]
+    parts = args.part or PARTS
+    scales = sorted(args.scale)
+
+    results: dict[str, Record] = {}
+    for day in days:
+        for part in parts:
+            results.update(bench_day(day, part, scales, args))
+
+    if args.save:
+        args.save.write_text(json.dumps({"seed": args.seed, "results": results}, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline["seed"] != args.seed:
+            print(f"baseline was generated with seed {baseline['seed']}")
+        if compare(results, baseline["results"], args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
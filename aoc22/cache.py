@@ -0,0 +1,81 @@
+"""On-disk cache of answers and parsed models.
+
+Entries are keyed by a hash of the input file and a hash of the day's
+solver source, so editing either one misses the cache. The cache is
+bounded in size and evicts the least recently used entries first.
+"""
+import hashlib
+import pickle
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from aoc22.days import ROOT
+
+CACHE_DIR = ROOT / ".cache"
+MAX_BYTES = 256 * 2**20
+
+
+class Cache:
+    def __init__(self, root: Path = CACHE_DIR, max_bytes: int = MAX_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._sources: dict[str, str] = {}
+
+    def source_hash(self, module: ModuleType) -> str:
+        name = module.__name__
+        if name not in self._sources:
+            assert module.__file__
+            source = Path(module.__file__).read_bytes()
+            self._sources[name] = hashlib.sha256(source).hexdigest()
+        return self._sources[name]
+
+    def key(self, module: ModuleType, input_digest: str) -> str:
+        digest = hashlib.sha256(self.source_hash(module).encode())
+        digest.update(input_digest.encode())
+        return f"{module.__name__}-{digest.hexdigest()[:32]}"
+
+    def path(self, name: str) -> Path:
+        return self.root / f"{name}.pickle"
+
+    def load(self, name: str) -> Any:
+        """Return the cached value, or raise KeyError on a miss."""
+        path = self.path(name)
+        try:
+            value = pickle.loads(path.read_bytes())
+        except FileNotFoundError:
+            raise KeyError(name)
+        except Exception:
+            path.unlink(missing_ok=True)
+            raise KeyError(name)
+        path.touch()
+        return value
+
+    def store(self, name: str, value: Any) -> bool:
+        """Cache a value, skipping values that do not survive a pickle round trip."""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.loads(blob)
+        except Exception:
+            return False
+        if len(blob) > self.max_bytes:
+            return False
+
+        self.root.mkdir(exist_ok=True)
+        self.path(name).write_bytes(blob)
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        entries = [(p, p.stat()) for p in self.root.glob("*.pickle")]
+        entries.sort(key=lambda e: e[1].st_mtime)
+        size = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+
+    def clear(self) -> None:
+        for path in self.root.glob("*.pickle"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,35 @@
+"""Discovery and loading of the day_N solution modules."""
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent.parent
+TEMPLATE = 0
+
+
+def day_numbers() -> list[int]:
+    days = []
+    for path in ROOT.glob("day_*/main.py"):
+        suffix = path.parent.name.removeprefix("day_")
+        if suffix.isdigit() and int(suffix) != TEMPLATE:
+            days.append(int(suffix))
+    return sorted(days)
+
+
+def load_day(day: int) -> ModuleType:
+    name = f"day_{day}"
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(name, ROOT / name / "main.py")
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def input_path(day: int, part: int, sample: bool) -> Path:
+    file_name = "sample" if sample else "input"
+    return ROOT / f"day_{day}" / f"{file_name}_{part}.txt"
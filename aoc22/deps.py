@@ -0,0 +1,37 @@
+"""Heavy and optional dependencies, loaded only when a solver first uses them."""
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any, Iterable, TypeVar
+
+T = TypeVar("T")
+
+show_progress = True
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module that is only executed on its first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def progress(iterable: Iterable[T], **kwargs: Any) -> Iterable[T]:
+    """Wrap ``iterable`` in a tqdm progress bar when tqdm is installed."""
+    if not show_progress:
+        return iterable
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        return iterable
+    return tqdm(iterable, **kwargs)
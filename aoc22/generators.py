@@ -0,0 +1,255 @@
+"""Seeded generators of valid puzzle inputs at a chosen scale.
+
+A scale of 1 produces an input about the size of the checked-in
+``input_*.txt`` file for that day; grids grow by the square root of the
+scale so their cell count follows it.
+"""
+import math
+import random
+import string
+from typing import Callable
+
+Generator = Callable[[random.Random, int], str]
+
+ITEMS = string.ascii_lowercase + string.ascii_uppercase
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23]
+
+
+def side(base: int, scale: int) -> int:
+    return max(2, round(base * math.sqrt(scale)))
+
+
+def day_1(rng: random.Random, scale: int) -> str:
+    elves = []
+    for _ in range(250 * scale):
+        snacks = [str(rng.randint(1000, 9999)) for _ in range(rng.randint(1, 15))]
+        elves.append("\n".join(snacks))
+    return "\n\n".join(elves) + "\n"
+
+
+def day_2(rng: random.Random, scale: int) -> str:
+    rounds = [
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(2500 * scale)
+    ]
+    return "\n".join(rounds) + "\n"
+
+
+def day_3(rng: random.Random, scale: int) -> str:
+    rucksacks = []
+    for _ in range(100 * scale):
+        items = rng.sample(ITEMS, len(ITEMS))
+        badge, pools = items[0], [items[1 + i * 17 : 18 + i * 17] for i in range(3)]
+        for pool in pools:
+            common, first, second = pool[0], pool[1:9], pool[9:]
+            size = rng.randint(4, 16)
+            a = [badge, common] + rng.choices(first, k=size - 2)
+            b = [common] + rng.choices(second, k=size - 1)
+            rng.shuffle(a)
+            rng.shuffle(b)
+            rucksacks.append("".join(a + b))
+    return "\n".join(rucksacks) + "\n"
+
+
+def day_4(rng: random.Random, scale: int) -> str:
+    pairs = []
+    for _ in range(1000 * scale):
+        ranges = []
+        for _ in range(2):
+            start = rng.randint(1, 99)
+            ranges.append(f"{start}-{rng.randint(start, 99)}")
+        pairs.append(",".join(ranges))
+    return "\n".join(pairs) + "\n"
+
+
+def day_5(rng: random.Random, scale: int) -> str:
+    stacks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(rng.randint(1, 8 * scale))]
+        for _ in range(9)
+    ]
+    height = max(len(s) for s in stacks)
+    levels = []
+    for level in range(height - 1, -1, -1):
+        cells = [f"[{s[level]}]" if level < len(s) else "   " for s in stacks]
+        levels.append(" ".join(cells))
+    levels.append(" ".join(f" {i} " for i in range(1, 10)))
+
+    sizes = [len(s) for s in stacks]
+    moves = []
+    for _ in range(500 * scale):
+        src = rng.choice([i for i, n in enumerate(sizes) if n > 1] or [0])
+        dst = rng.choice([i for i in range(9) if i != src])
+        qty = rng.randint(1, max(1, min(sizes[src] - 1, 8 * scale)))
+        if sizes[src] - qty < 1:
+            continue
+        sizes[src] -= qty
+        sizes[dst] += qty
+        moves.append(f"move {qty} from {src + 1} to {dst + 1}")
+
+    return "\n".join(levels) + "\n\n" + "\n".join(moves) + "\n"
+
+
+def day_6(rng: random.Random, scale: int) -> str:
+    # an early start-of-packet marker, and a start-of-message marker at the end
+    packet = "".join(rng.sample(string.ascii_lowercase[3:], 4))
+    noise = "".join(rng.choices("abc", k=4096 * scale))
+    message = "".join(rng.sample(string.ascii_lowercase[3:], 14))
+    return packet + noise + message + "\n"
+
+
+def day_7(rng: random.Random, scale: int) -> str:
+    children: dict[int, list[int]] = {0: []}
+    depth = {0: 0}
+    parents = [0]
+    for node in range(1, 180 * scale):
+        parent = rng.choice(parents)
+        children[parent].append(node)
+        children[node] = []
+        depth[node] = depth[parent] + 1
+        if depth[node] < 12:
+            parents.append(node)
+
+    lines = ["$ cd /"]
+
+    def visit(node: int) -> None:
+        lines.append("$ ls")
+        for child in children[node]:
+            lines.append(f"dir d{child}")
+        for i in range(rng.randint(0, 6)):
+            lines.append(f"{rng.randint(1000, 300000)} f{i}.{rng.choice('abc')}")
+        for child in children[node]:
+            lines.append(f"$ cd d{child}")
+            visit(child)
+            lines.append("$ cd ..")
+
+    visit(0)
+    return "\n".join(lines) + "\n"
+
+
+def day_8(rng: random.Random, scale: int) -> str:
+    n = side(99, scale)
+    rows = ["".join(rng.choices(string.digits, k=n)) for _ in range(n)]
+    return "\n".join(rows) + "\n"
+
+
+def day_9(rng: random.Random, scale: int) -> str:
+    moves = [f"{rng.choice('RLUD')} {rng.randint(1, 20)}" for _ in range(2000 * scale)]
+    return "\n".join(moves) + "\n"
+
+
+def day_10(rng: random.Random, scale: int) -> str:
+    program = []
+    for _ in range(140 * scale):
+        if rng.random() < 0.3:
+            program.append("noop")
+            continue
+        program.append(f"addx {rng.randint(-10, 10)}")
+    return "\n".join(program) + "\n"
+
+
+def day_11(rng: random.Random, scale: int) -> str:
+    count = 8 * scale
+    monkeys = []
+    for i in range(count):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        operation = rng.choice([f"* {rng.randint(2, 19)}", f"+ {rng.randint(1, 8)}"])
+        if i % 8 == 0:
+            operation = "* old"
+        targets = rng.sample([m for m in range(count) if m != i], 2)
+        monkeys.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = old {operation}\n"
+            f"  Test: divisible by {rng.choice(PRIMES)}\n"
+            f"    If true: throw to monkey {targets[0]}\n"
+            f"    If false: throw to monkey {targets[1]}\n"
+        )
+    return "\n".join(monkeys)
+
+
+def day_12(rng: random.Random, scale: int) -> str:
+    height, width = side(41, scale), side(61, scale)
+    rows = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            elevation = x * 26 // width
+            if y > 0:
+                elevation = max(0, elevation - rng.randint(0, 1))
+            row.append(chr(97 + elevation))
+        rows.append(row)
+    rows[height // 2][0] = "S"
+    rows[height // 2][-1] = "E"
+    return "\n".join("".join(r) for r in rows) + "\n"
+
+
+def packet(rng: random.Random, depth: int = 0) -> str:
+    items = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            items.append(packet(rng, depth + 1))
+            continue
+        items.append(str(rng.randint(0, 10)))
+    return "[" + ",".join(items) + "]"
+
+
+def day_13(rng: random.Random, scale: int) -> str:
+    pairs = [f"{packet(rng)}\n{packet(rng)}\n" for _ in range(150 * scale)]
+    return "\n".join(pairs)
+
+
+def day_14(rng: random.Random, scale: int) -> str:
+    width, depth = side(80, scale), side(170, scale)
+    left, right = 500 - width // 2, 500 + width // 2
+    paths = [f"{left},{depth} -> {left},{depth}", f"{right},{depth} -> {right},{depth}"]
+    for _ in range(140 * scale):
+        x, y = rng.randint(left, right), rng.randint(13, depth)
+        nodes = [f"{x},{y}"]
+        for i in range(rng.randint(1, 4)):
+            if i % 2:
+                y = min(depth, max(13, y + rng.randint(-8, 8)))
+            else:
+                x += rng.randint(-8, 8)
+            nodes.append(f"{x},{y}")
+        paths.append(" -> ".join(nodes))
+    return "\n".join(paths) + "\n"
+
+
+def day_15(rng: random.Random, scale: int) -> str:
+    bound = 4000000
+    hx, hy = rng.randint(0, bound), rng.randint(0, bound)
+    sensors = []
+    for _ in range(23 * scale):
+        sx, sy = rng.randint(-bound // 4, bound * 5 // 4), rng.randint(0, bound)
+        reach = abs(sx - hx) + abs(sy - hy) - 1
+        if reach < 1:
+            continue
+        dx = rng.randint(-reach, reach)
+        dy = (reach - abs(dx)) * rng.choice([-1, 1])
+        sensors.append(
+            f"Sensor at x={sx}, y={sy}: closest beacon is at x={sx + dx}, y={sy + dy}"
+        )
+    return "\n".join(sensors) + "\n"
+
+
+GENERATORS: dict[int, Generator] = {
+    1: day_1,
+    2: day_2,
+    3: day_3,
+    4: day_4,
+    5: day_5,
+    6: day_6,
+    7: day_7,
+    8: day_8,
+    9: day_9,
+    10: day_10,
+    11: day_11,
+    12: day_12,
+    13: day_13,
+    14: day_14,
+    15: day_15,
+}
+
+
+def generate(day: int, scale: int, seed: int = 0) -> str:
+    rng = random.Random(f"{seed}-{day}-{scale}")
+    return GENERATORS[day](rng, scale)
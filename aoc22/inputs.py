@@ -0,0 +1,43 @@
+"""Streaming access to puzzle inputs that never holds the whole file as a string."""
+import hashlib
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+@contextmanager
+def mapped(path: Path) -> Iterator[mmap.mmap | bytes]:
+    """Map the file read-only into memory; empty files map to ``b""``."""
+    with open(path, "rb") as file:
+        if Path(path).stat().st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def lines(path: Path) -> Iterator[str]:
+    """Yield the lines of the file one at a time, without their newline."""
+    with open(path) as file:
+        for line in file:
+            yield line.rstrip("\n")
+
+
+def records(path: Path) -> Iterator[list[str]]:
+    """Yield the groups of lines separated by blank lines."""
+    record: list[str] = []
+    for line in lines(path):
+        if line:
+            record.append(line)
+            continue
+        if record:
+            yield record
+        record = []
+    if record:
+        yield record
+
+
+def digest(path: Path) -> str:
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
@@ -0,0 +1,80 @@
+"""Opt-in counters, profiling and peak memory capture for solver runs.
+
+Solvers report inner-loop work with ``count``, which does nothing unless
+a ``collect`` block is active. Hot loops should tally locally and count
+once per call rather than once per iteration.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+if TYPE_CHECKING:
+    import cProfile
+
+PROFILE_ENTRIES = 25
+
+counters: Counter[str] = Counter()
+enabled = False
+
+
+def count(name: str, n: int = 1) -> None:
+    if enabled:
+        counters[name] += n
+
+
+@dataclass
+class Report:
+    counters: dict[str, int] = field(default_factory=dict)
+    peak_memory: Optional[int] = None
+    profile: list[dict[str, Any]] = field(default_factory=list)
+
+
+def profile_entries(profiler: "cProfile.Profile") -> list[dict[str, Any]]:
+    import pstats
+
+    stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+    entries = []
+    for (file, line, func), (_, calls, own, cumulative, _) in stats.items():
+        entries.append(
+            {
+                "function": f"{file}:{line}({func})",
+                "calls": calls,
+                "own": own,
+                "cumulative": cumulative,
+            }
+        )
+    entries.sort(key=lambda e: e["cumulative"], reverse=True)
+    return entries[:PROFILE_ENTRIES]
+
+
+@contextmanager
+def collect(profile: bool = False, memory: bool = False) -> Iterator[Report]:
+    """Collect counters, and optionally a profile and peak memory, into a report."""
+    global enabled
+    report = Report()
+    counters.clear()
+    enabled = True
+
+    profiler = None
+    if profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    if memory:
+        import tracemalloc
+
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    try:
+        yield report
+    finally:
+        if profiler:
+            profiler.disable()
+            report.profile = profile_entries(profiler)
+        if memory:
+            report.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        enabled = False
+        report.counters = dict(counters)
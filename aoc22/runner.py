@@ -0,0 +1,407 @@
+"""Run any set of days, parts and input kinds, timing each phase separately."""
+import argparse
+import contextlib
+import inspect
+import io
+import json
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from aoc22 import deps, instrument
+from aoc22.cache import MAX_BYTES, Cache
+from aoc22.days import day_numbers, input_path, load_day
+from aoc22.inputs import digest, lines, records
+
+PARTS = (1, 2)
+KINDS = ("sample", "input")
+
+
+@dataclass
+class Timing:
+    read: float = 0.0
+    parse: float = 0.0
+    solve: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.read + self.parse + self.solve
+
+
+@dataclass
+class Result:
+    day: int
+    part: int
+    sample: bool
+    answer: Any
+    timing: Timing
+    output: str = ""
+    cached: bool = False
+    error: str = ""
+    report: Optional[instrument.Report] = None
+
+    @property
+    def kind(self) -> str:
+        return "sample" if self.sample else "input"
+
+
+def solver(module: ModuleType, part: int) -> Callable[..., Any]:
+    return module.part_one if part == 1 else module.part_two
+
+
+def solve(func: Callable[..., Any], data: Any, sample: bool) -> Any:
+    if "sample" in inspect.signature(func).parameters:
+        return func(data, sample=sample)
+    return func(data)
+
+
+@dataclass
+class Options:
+    cache: Optional[Cache] = None
+    timeout: Optional[float] = None
+    stream: bool = False
+    instrument: bool = False
+    profile: bool = False
+    memory: bool = False
+    progress: bool = True
+    backend: Optional[str] = None
+
+
+def run_parts(
+    day: int,
+    parts: Iterable[int],
+    path: Path,
+    sample: bool = False,
+    options: Options = Options(),
+) -> list[Result]:
+    """Solve ``parts`` from a single read and, at most, a single parse of ``path``."""
+    module = load_day(day)
+    cache = options.cache
+    deps.show_progress = options.progress
+    timing = Timing()
+    output = io.StringIO()
+    parser = backend(module, options.backend)
+
+    start = time.perf_counter()
+    input = None
+    if not options.stream and not parser:
+        with open(path) as file:
+            input = file.read()
+    timing.read = time.perf_counter() - start
+
+    # answers and models from different parsers are cached apart
+    mode = options.backend if parser else "stream" if options.stream else "text"
+    key = f"{cache.key(module, digest(path))}.{mode}" if cache else ""
+    data: Any = None
+    parsed = False
+
+    results = []
+    for part in parts:
+        name = f"{key}.part_{part}.{'sample' if sample else 'input'}"
+        if cache:
+            try:
+                answer = cache.load(name)
+                results.append(Result(day, part, sample, answer, timing, cached=True))
+                timing = Timing()
+                continue
+            except KeyError:
+                pass
+
+        with contextlib.redirect_stdout(output), collect(options) as report:
+            if not parsed:
+                start = time.perf_counter()
+                data = parse(module, path, input, key, cache, parser)
+                timing.parse = time.perf_counter() - start
+                parsed = True
+
+            start = time.perf_counter()
+            answer = solve(solver(module, part), data, sample)
+            timing.solve = time.perf_counter() - start
+
+        if cache:
+            cache.store(name, answer)
+        result = Result(day, part, sample, answer, timing, output.getvalue())
+        result.report = report
+        results.append(result)
+        timing = Timing()
+        output = io.StringIO()
+
+    return results
+
+
+@contextlib.contextmanager
+def collect(options: Options) -> Iterator[Optional[instrument.Report]]:
+    if not options.instrument:
+        yield None
+        return
+    with instrument.collect(options.profile, options.memory) as report:
+        yield report
+
+
+def backend(
+    module: ModuleType, name: Optional[str]
+) -> Optional[Callable[[Path], Any]]:
+    """Return the day's parser for the named backend, if it has one."""
+    if not name:
+        return None
+    return getattr(module, "BACKENDS", {}).get(name)
+
+
+def parse_model(
+    module: ModuleType,
+    path: Path,
+    input: Optional[str],
+    parser: Optional[Callable[[Path], Any]] = None,
+) -> Any:
+    """Parse the whole input, or stream it through the day's file, record or line parser."""
+    if parser:
+        return parser(path)
+    if input is not None:
+        return module.parse_input(input)
+    if hasattr(module, "parse_file"):
+        return module.parse_file(path)
+    if hasattr(module, "parse_records"):
+        return module.parse_records(records(path))
+    if hasattr(module, "parse_lines"):
+        return module.parse_lines(lines(path))
+    return module.parse_input(path.read_text())
+
+
+def parse(
+    module: ModuleType,
+    path: Path,
+    input: Optional[str],
+    key: str,
+    cache: Optional[Cache],
+    parser: Optional[Callable[[Path], Any]] = None,
+) -> Any:
+    if not cache:
+        return parse_model(module, path, input, parser)
+
+    name = f"{key}.model"
+    try:
+        return cache.load(name)
+    except KeyError:
+        data = parse_model(module, path, input, parser)
+        cache.store(name, data)
+        return data
+
+
+def run_file(
+    day: int, part: int, path: Path, sample: bool = False, options: Options = Options()
+) -> Result:
+    return run_parts(day, [part], path, sample, options)[0]
+
+
+def run_job(day: int, part: int, sample: bool, options: Options = Options()) -> Result:
+    return run_file(day, part, input_path(day, part, sample), sample, options)
+
+
+class JobTimeout(Exception):
+    pass
+
+
+def raise_timeout(signum: int, frame: Any) -> None:
+    raise JobTimeout
+
+
+def run_with_timeout(
+    day: int, parts: list[int], path: Path, sample: bool, options: Options
+) -> list[Result]:
+    """Run a job, turning a timeout or a solver error into an error result per part.
+
+    The job gives up after ``options.timeout`` seconds of its own run time.
+    """
+    timeout = options.timeout
+    if timeout:
+        previous = signal.signal(signal.SIGALRM, raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return run_parts(day, parts, path, sample, options)
+    except JobTimeout:
+        error = f"timeout {timeout:g}s"
+    except Exception as e:
+        error = repr(e)
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+    return [Result(day, p, sample, None, Timing(), error=error) for p in parts]
+
+
+def run_jobs(
+    jobs: list[tuple[int, list[int], Path, bool]],
+    options: Options = Options(),
+    workers: int = 1,
+) -> Iterator[Result]:
+    """Run jobs serially or on a process pool, yielding results in job order."""
+    if workers == 1:
+        for job in jobs:
+            yield from run_with_timeout(*job, options)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_with_timeout, *job, options) for job in jobs]
+        for future in futures:
+            yield from future.result()
+
+
+def result_record(result: Result) -> dict[str, Any]:
+    record = {
+        "day": result.day,
+        "part": result.part,
+        "kind": result.kind,
+        "answer": str(result.answer),
+        "cached": result.cached,
+        "error": result.error,
+        "timing": asdict(result.timing) | {"total": result.timing.total},
+    }
+    if result.report:
+        record |= asdict(result.report)
+    return record
+
+
+def write_report(path: Path, argv: list[str], results: list[Result]) -> None:
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "argv": argv,
+        "results": [result_record(r) for r in results],
+    }
+    path.write_text(json.dumps(report, indent=2))
+
+
+def format_timing(timing: Timing) -> str:
+    return (
+        f"read {timing.read * 1000:9.3f}ms  "
+        f"parse {timing.parse * 1000:9.3f}ms  "
+        f"solve {timing.solve * 1000:9.3f}ms  "
+        f"total {timing.total * 1000:9.3f}ms"
+    )
+
+
+def format_result(result: Result) -> str:
+    return (
+        f"day {result.day:>2} part {result.part} {result.kind:<6} "
+        f"{result.error or str(result.answer):>16}  {format_timing(result.timing)}"
+        f"{'  (cached)' if result.cached else ''}"
+    )
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m aoc22", description=__doc__)
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("-p", "--part", nargs="+", type=int, choices=PARTS)
+    parser.add_argument("-k", "--kind", nargs="+", choices=KINDS)
+    parser.add_argument(
+        "-b",
+        "--both",
+        action="store_true",
+        help="solve both parts from one parse of the part one input",
+    )
+    parser.add_argument(
+        "-s",
+        "--stream",
+        action="store_true",
+        help="stream the input through the day's line or record parser",
+    )
+    parser.add_argument(
+        "--backend",
+        help="parse with the day's named backend (such as numpy) where it has one",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        help="bypass the on-disk answer and model cache",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=MAX_BYTES // 2**20,
+        help="cache size limit in MiB",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes to run jobs on (0: one per CPU)",
+    )
+    parser.add_argument(
+        "-t", "--timeout", type=float, help="give up on a job after this many seconds"
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help="write timings and hot-path counters for every job to this JSON file",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="add a cProfile summary to the report"
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="add tracemalloc peak memory to the report"
+    )
+    parser.add_argument(
+        "--no-progress",
+        dest="progress",
+        action="store_false",
+        help="hide progress bars from long-running solvers",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="show what the solvers print"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> None:
+    args = parse_args(argv)
+    days = args.days or day_numbers()
+    parts = args.part or PARTS
+    kinds = args.kind or KINDS
+
+    cache = Cache(max_bytes=args.cache_size * 2**20) if args.cache else None
+    options = Options(
+        cache,
+        args.timeout,
+        args.stream,
+        instrument=bool(args.report),
+        profile=args.profile,
+        memory=args.memory,
+        progress=args.progress,
+        backend=args.backend,
+    )
+    workers = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+
+    jobs = []
+    for day in days:
+        for kind in kinds:
+            sample = kind == "sample"
+            if args.both:
+                jobs.append((day, list(PARTS), input_path(day, 1, sample), sample))
+                continue
+            for part in parts:
+                jobs.append((day, [part], input_path(day, part, sample), sample))
+
+    total = Timing()
+    results = []
+    start = time.perf_counter()
+    for result in run_jobs(jobs, options, workers):
+        results.append(result)
+        if args.verbose and result.output:
+            print(result.output, end="")
+        print(format_result(result))
+        total.read += result.timing.read
+        total.parse += result.timing.parse
+        total.solve += result.timing.solve
+    wall = time.perf_counter() - start
+
+    print(f"{'all':>37}  {format_timing(total)}  wall {wall * 1000:9.3f}ms")
+
+    if args.report:
+        write_report(args.report, argv, results)
@@ -0,0 +1,61 @@
+"""Fail when importing every day module takes longer than a startup budget.
+
+Each measurement runs in a fresh interpreter so nothing is already
+imported, and the fastest of several runs is compared to the budget.
+"""
+import argparse
+import subprocess
+import sys
+
+from aoc22.days import ROOT
+
+BUDGET = 0.12
+RUNS = 5
+HEAVY = ("numpy", "tqdm")
+
+PROBE = f"""
+import sys, time
+start = time.perf_counter()
+from aoc22.days import day_numbers, load_day
+for day in day_numbers():
+    load_day(day)
+elapsed = time.perf_counter() - start
+# lazily imported modules stay a ModuleType subclass until first used
+loaded = [m for m in {HEAVY!r} if type(sys.modules.get(m)) is type(sys)]
+print(elapsed, *loaded)
+"""
+
+
+def measure() -> tuple[float, list[str]]:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(output[0]), output[1:]
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m aoc22.startup", description=__doc__)
+    parser.add_argument("--budget", type=float, default=BUDGET, help="seconds")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> None:
+    args = parse_args(argv)
+    runs = [measure() for _ in range(args.runs)]
+    elapsed, loaded = min(runs)
+
+    print(f"importing the day registry took {elapsed * 1000:.1f}ms", end="")
+    print(f" (budget {args.budget * 1000:.1f}ms)")
+    if loaded:
+        print(f"heavy modules loaded at import: {', '.join(loaded)}")
+    if elapsed > args.budget or loaded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
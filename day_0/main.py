@@ -1,4 +1,7 @@
 
+def parse_input(input: str) -> str:
+    return input
+
 def part_one(input: str) -> int:
     print(input)
     return 0
@@ -14,10 +17,11 @@ def main(p: int, s: bool) -> int:
     file_path = file_name + file_version
     with open(file_path) as file:
         input = file.read()
-    
+
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
@@ -1,23 +1,23 @@
+from __future__ import annotations
 
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional
 
-def part_one(input: str) -> int:
-    cals: list[str] = input.split('\n')
-    breaks: list[int] = [i for i, n in enumerate(cals) if n == '']
-    
-    intervals: list[tuple[int, int]] = [(0, breaks[0])]
-    for i in range(1, len(breaks)):
-        start: int = intervals[i - 1][1] + 1
-        finish: int = breaks[i]
-        intervals.append((start, finish))
-    
-    elves: list[list[int]] = [
-        [int(cals[i]) for i in range(s, f)]
-        for s, f in intervals
-    ]
+from aoc22.deps import lazy_import
+from aoc22.inputs import mapped
+
+np = lazy_import("numpy")
 
-    return max([sum(c) for c in elves])
+TOP = 3
+PARALLEL_SIZE = 64 * 2**20
+BLOCK = 2**22
 
-def part_two(input: str) -> int:
+
+def parse_input(input: str) -> list[int]:
     cals: list[str] = input.split('\n')
     breaks: list[int] = [i for i, n in enumerate(cals) if n == '']
     
@@ -32,7 +32,152 @@ def part_two(input: str) -> int:
         for s, f in intervals
     ]
 
-    top_3 = sorted([sum(c) for c in elves])
+    return [sum(c) for c in elves]
+
+def elf_totals(lines: Iterable[str]) -> Iterator[int]:
+    total: int = 0
+    counting: bool = False
+    for line in lines:
+        line = line.strip()
+        if line == '':
+            yield total
+            total, counting = 0, False
+            continue
+        total += int(line)
+        counting = True
+    if counting:
+        yield total
+
+def top_calories(totals: Iterable[int], k: int = TOP) -> list[int]:
+    top: list[int] = []
+    for total in totals:
+        if len(top) < k:
+            heapq.heappush(top, total)
+        elif total > top[0]:
+            heapq.heapreplace(top, total)
+    return sorted(top)
+
+def parse_lines(lines: Iterable[str], k: int = TOP) -> list[int]:
+    return top_calories(elf_totals(lines), k)
+
+def chunk_bounds(path: Path, chunks: int) -> list[tuple[int, int]]:
+    with mapped(path) as buffer:
+        size = len(buffer)
+        starts = [0]
+        for i in range(1, chunks):
+            blank = buffer.find(b'\n\n', max(size * i // chunks, starts[-1]))
+            if blank < 0:
+                break
+            starts.append(blank + 2)
+    ends = starts[1:] + [size]
+    return [(s, e) for s, e in zip(starts, ends) if s < e]
+
+def read_range(file: BinaryIO, start: int, end: int) -> Iterator[str]:
+    file.seek(start)
+    position: int = start
+    for line in file:
+        if position >= end:
+            break
+        position += len(line)
+        yield line.decode()
+
+def chunk_top(path: Path, start: int, end: int, k: int = TOP) -> list[int]:
+    with open(path, 'rb') as file:
+        return top_calories(elf_totals(read_range(file, start, end)), k)
+
+def parallel_calories(
+    path: Path, workers: Optional[int] = None, k: int = TOP
+) -> list[int]:
+    workers = workers or os.cpu_count() or 1
+    bounds = chunk_bounds(path, workers * 4)
+    with ProcessPoolExecutor(workers) as pool:
+        tops = [pool.submit(chunk_top, path, s, e, k) for s, e in bounds]
+        return top_calories(chain.from_iterable(t.result() for t in tops), k)
+
+def parse_file(path: Path) -> list[int]:
+    if os.path.getsize(path) < PARALLEL_SIZE:
+        with open(path) as file:
+            return parse_lines(file)
+    return parallel_calories(path)
+
+def valid_bytes(data: np.ndarray) -> bool:
+    digits = (data >= ord('0')) & (data <= ord('9'))
+    newlines = data == ord('\n')
+    # a carriage return is only allowed as part of a CRLF or final line ending
+    returns = data == ord('\r')
+    returns[:-1] &= newlines[1:]
+    return bool((digits | newlines | returns).all())
+
+def line_values(data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    ends = np.flatnonzero(data == ord('\n'))
+    if len(data) and data[-1] != ord('\n'):
+        ends = np.append(ends, len(data))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    crlf = (ends > starts) & (data[np.maximum(ends - 1, 0)] == ord('\r'))
+    ends = ends - crlf
+    lengths = ends - starts
+
+    values = np.zeros(len(ends), dtype=np.int64)
+    for digit in range(int(lengths.max(initial=0))):
+        live = lengths > digit
+        digits = data[ends[live] - 1 - digit].astype(np.int64) - ord('0')
+        values[live] += digits * 10**digit
+    return values, lengths == 0
+
+def line_blocks(buffer: bytes, size: int = BLOCK) -> Iterator[tuple[int, int]]:
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b'\n', start + size) + 1 or len(buffer)
+        yield start, end
+        start = end
+
+def block_lines(
+    buffer: bytes, start: int, end: int
+) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """Read a block of lines, or return None if a line holds anything but digits."""
+    data = np.frombuffer(buffer, np.uint8, count=end - start, offset=start)
+    if not valid_bytes(data):
+        return None
+    return line_values(data)
+
+def fold_block(
+    values: np.ndarray, blanks: np.ndarray, carry: Optional[int]
+) -> tuple[np.ndarray, Optional[int]]:
+    """Total the elves that end in this block, and carry the one still open."""
+    if carry is not None:
+        values = np.concatenate(([carry], values))
+        blanks = np.concatenate(([False], blanks))
+    firsts = ~blanks & np.concatenate(([True], blanks[:-1]))
+    if not firsts.any():
+        return np.zeros(0, dtype=np.int64), None
+    totals = np.add.reduceat(values, np.flatnonzero(firsts))
+    if blanks[-1]:
+        return totals, None
+    return totals[:-1], int(totals[-1])
+
+def parse_numpy(path: Path, k: int = TOP) -> list[int]:
+    top: list[int] = []
+    carry: Optional[int] = None
+    with mapped(path) as buffer:
+        for start, end in line_blocks(buffer):
+            lines = block_lines(buffer, start, end)
+            if lines is None:
+                raise ValueError('calorie lines must hold only digits')
+            totals, carry = fold_block(*lines, carry)
+            if len(totals) > k:
+                totals = np.partition(totals, -k)[-k:]
+            top = top_calories(chain(top, totals.tolist()), k)
+    if carry is not None:
+        top = top_calories(chain(top, [carry]), k)
+    return top
+
+BACKENDS = {'numpy': parse_numpy}
+
+def part_one(totals: list[int]) -> int:
+    return max(totals)
+
+def part_two(totals: list[int]) -> int:
+    top_3 = sorted(totals)
     print(top_3[-3:])
     
 
@@ -46,10 +191,11 @@ def main(p: int, s: bool) -> int:
     file_path = file_name + file_version
     with open(file_path) as file:
         input = file.read()
-    
+
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
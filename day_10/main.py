@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from enum import StrEnum, auto
 
-import numpy as np
+from aoc22.deps import lazy_import
+
+np = lazy_import("numpy")
 
 
 class InstructionType(StrEnum):
@@ -67,8 +71,7 @@ def parse_input(input: str) -> list[Instruction]:
     return instructions
 
 
-def part_one(input: str) -> int:
-    instructions = parse_input(input)
+def part_one(instructions: list[Instruction]) -> int:
     register = Register(np.ones(220, dtype=int))
     for i in instructions:
         register.execute_instruction(i)
@@ -78,8 +81,7 @@ def part_one(input: str) -> int:
     return register.total_strength
 
 
-def part_two(input: str) -> int:
-    instructions = parse_input(input)
+def part_two(instructions: list[Instruction]) -> int:
     register = Register(np.ones(240, dtype=int))
     for i in instructions:
         register.execute_instruction(i)
@@ -105,9 +107,10 @@ def main(p: int, s: bool) -> int:
     with open(file_path) as file:
         input = file.read()
 
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
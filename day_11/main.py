@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import Callable
+from dataclasses import dataclass, replace
+from typing import Callable, Iterable
+
+from aoc22 import instrument
 
 
 @dataclass
@@ -11,6 +13,7 @@ class Monkey:
     factors: bool = False
 
     def inspect_items(self, relief) -> list[tuple[int, int]]:
+        instrument.count("day_11.inspections", len(self.items))
         trowed_items: list[tuple[int, int]] = []
         while len(self.items):
             self.inspections += 1
@@ -72,6 +75,15 @@ def parse_input(input: str) -> dict[int, Monkey]:
     return {i: parse_monkey(n) for i, n in enumerate(monkey_notes)}
 
 
+def parse_records(records: Iterable[list[str]]) -> dict[int, Monkey]:
+    notes = ([r.strip() for r in record] for record in records)
+    return {i: parse_monkey(n) for i, n in enumerate(notes)}
+
+
+def copy_monkeys(monkeys: dict[int, Monkey]) -> dict[int, Monkey]:
+    return {i: replace(m, items=list(m.items)) for i, m in monkeys.items()}
+
+
 def process_round(monkeys: dict[int, Monkey], relief=3) -> dict[int, Monkey]:
     for m in monkeys.values():
         throwed_items = m.inspect_items(relief)
@@ -80,8 +92,8 @@ def process_round(monkeys: dict[int, Monkey], relief=3) -> dict[int, Monkey]:
     return monkeys
 
 
-def part_one(input: str) -> int:
-    monkeys = parse_input(input)
+def part_one(monkeys: dict[int, Monkey]) -> int:
+    monkeys = copy_monkeys(monkeys)
     for _ in range(20):
         monkeys = process_round(monkeys)
 
@@ -89,8 +101,8 @@ def part_one(input: str) -> int:
     return monkey_business[-1] * monkey_business[-2]
 
 
-def part_two(input: str) -> int:
-    monkeys = parse_input(input)
+def part_two(monkeys: dict[int, Monkey]) -> int:
+    monkeys = copy_monkeys(monkeys)
     for _ in range(10000):
         monkeys = process_round(monkeys, relief=1)
 
@@ -105,9 +117,10 @@ def main(p: int, s: bool) -> int:
     with open(file_path) as file:
         input = file.read()
 
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
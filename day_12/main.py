@@ -4,7 +4,10 @@ import heapq
 from dataclasses import dataclass, field
 from typing import Optional
 
-import numpy as np
+from aoc22 import instrument
+from aoc22.deps import lazy_import
+
+np = lazy_import("numpy")
 
 
 @dataclass
@@ -64,7 +67,7 @@ def parse_char(char: str) -> int:
     return ord(char) - 97
 
 
-def parse_input(input: str) -> HeightMap:
+def parse_height_map(input: str) -> HeightMap:
     char_lists = np.array([list(i) for i in input.splitlines()])
     sy, sx = [int(i) for i in np.where(char_lists == "S")]
     ey, ex = [int(i) for i in np.where(char_lists == "E")]
@@ -117,10 +120,12 @@ def shortest_path(
 
     # Create a priority queue to keep track of nodes to visit
     queue = [(0, start)]
+    pops = 0
 
     while queue:
         # Get the node with the smallest distance from the start node
         current_distance, current_node = heapq.heappop(queue)
+        pops += 1
 
         # Stop if we've reached the end node
         if current_node == end:
@@ -144,6 +149,8 @@ def shortest_path(
                 # Add the neighbor to the priority queue
                 heapq.heappush(queue, (distance, neighbor))
 
+    instrument.count("day_12.heap_pops", pops)
+
     # Construct the shortest path by working backwards from the end node
     path = []
     current_node = end
@@ -155,27 +162,29 @@ def shortest_path(
     return path
 
 
+def parse_input(input: str) -> tuple[HeightMap, Graph]:
+    height_map = parse_height_map(input)
+    return height_map, create_graph(height_map)
+
+
 def find_starts(height_map: HeightMap) -> list[tuple[int, int]]:
     starts = np.where(height_map.elevation == 0)
     return [(y, x) for y, x in zip(starts[0], starts[1])]
 
 
-def part_one(input: str) -> int:
-    height_map = parse_input(input)
+def part_one(data: tuple[HeightMap, Graph]) -> int:
+    height_map, graph = data
     height_map.print()
 
-    graph = create_graph(height_map)
     path = shortest_path(graph, height_map.start, height_map.end)
 
     return len(path) - 1
 
 
-def part_two(input: str) -> int:
-    height_map = parse_input(input)
+def part_two(data: tuple[HeightMap, Graph]) -> int:
+    height_map, graph = data
     height_map.print()
 
-    graph = create_graph(height_map)
-
     paths = []
     potential_starts = find_starts(height_map)
     for start in potential_starts:
@@ -194,9 +203,10 @@ def main(p: int, s: bool) -> int:
     with open(file_path) as file:
         input = file.read()
 
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ from __future__ import annotations
 from ast import literal_eval
 from functools import cmp_to_key
 from itertools import zip_longest
+from typing import Iterable
 
 
 def parse_input(input: str) -> list[tuple[int | list, int | list]]:
@@ -10,6 +11,10 @@ def parse_input(input: str) -> list[tuple[int | list, int | list]]:
     return [(lines[i], lines[i + 1]) for i in range(0, len(lines), 2)]
 
 
+def parse_records(records: Iterable[list[str]]) -> list[tuple[int | list, int | list]]:
+    return [(literal_eval(left), literal_eval(right)) for left, right in records]
+
+
 def comp(left: int, right: int) -> int:
     if left == right:
         return 0
@@ -39,8 +44,7 @@ def compare(p1: int | list, p2: int | list) -> int:
     return comp(len(p1), len(p2))
 
 
-def part_one(input: str) -> int:
-    pairs = parse_input(input)
+def part_one(pairs: list[tuple[int | list, int | list]]) -> int:
     correct = 0
     for i, p in enumerate(pairs, 1):
         l, r = p
@@ -49,8 +53,7 @@ def part_one(input: str) -> int:
     return correct
 
 
-def part_two(input: str) -> int:
-    pairs = parse_input(input)
+def part_two(pairs: list[tuple[int | list, int | list]]) -> int:
     packets = [p for packets in pairs for p in packets] + [[[2]]] + [[[6]]]
 
     sorted_packets = sorted(packets, key=cmp_to_key(compare), reverse=True)
@@ -69,9 +72,10 @@ def main(p: int, s: bool) -> int:
     with open(file_path) as file:
         input = file.read()
 
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
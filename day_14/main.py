@@ -1,8 +1,11 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 
-import numpy as np
-from numpy.core.multiarray import array
-from numpy.lib.stride_tricks import sliding_window_view
+from aoc22 import instrument
+from aoc22.deps import lazy_import
+
+np = lazy_import("numpy")
 
 
 @dataclass
@@ -48,8 +51,9 @@ def get_cave_dimension(rocks: list[np.ndarray]) -> Rect:
 
 
 def adjust_w(rock: np.ndarray, x: int) -> np.ndarray:
-    rock[:, 0] -= x
-    return rock
+    adjusted = rock.copy()
+    adjusted[:, 0] -= x
+    return adjusted
 
 
 def lines_to_rect(rock_lines: list[list[np.ndarray]]) -> list[Rect]:
@@ -72,7 +76,9 @@ def find_rocks(dim: Rect, rocks: list[np.ndarray]) -> list[Rect]:
         if len(adj_rock) == 2:
             rock_lines.append(list(adj_rock))
             continue
-        nodes = sliding_window_view(adj_rock, window_shape=(2, 2)).squeeze()
+        nodes = np.lib.stride_tricks.sliding_window_view(
+            adj_rock, window_shape=(2, 2)
+        ).squeeze()
         rock_lines += [list(n) for n in nodes]
 
     return lines_to_rect(rock_lines)
@@ -90,31 +96,36 @@ def drop_sand(cave: np.ndarray, dim: Rect) -> bool:
     start = (0, 500 - dim.x)
     next = start
     current = None
-    while True:
-        if cave[start] == 8:
-            return True
-        if next[0] == dim.h:
-            return True
-        if cave[next] in [1, 8]:
-            left = (next[0], next[1] - 1)
-            right = (next[0], next[1] + 1)
-            if left[1] < 0:
+    steps = 0
+    try:
+        while True:
+            steps += 1
+            if cave[start] == 8:
                 return True
-            if cave[left] not in [1, 8]:
-                current = next
-                next = left
-                continue
-            if right[1] == dim.w:
+            if next[0] == dim.h:
                 return True
-            if cave[right] not in [1, 8]:
-                current = right
-                next = right
-                continue
-            cave[current] = 8
-            break
-        current = next
-        next = (next[0] + 1, next[1])
-    return False
+            if cave[next] in [1, 8]:
+                left = (next[0], next[1] - 1)
+                right = (next[0], next[1] + 1)
+                if left[1] < 0:
+                    return True
+                if cave[left] not in [1, 8]:
+                    current = next
+                    next = left
+                    continue
+                if right[1] == dim.w:
+                    return True
+                if cave[right] not in [1, 8]:
+                    current = right
+                    next = right
+                    continue
+                cave[current] = 8
+                break
+            current = next
+            next = (next[0] + 1, next[1])
+        return False
+    finally:
+        instrument.count("day_14.grain_steps", steps)
 
 
 def add_floor(rocks: list[np.ndarray]) -> np.ndarray:
@@ -124,8 +135,7 @@ def add_floor(rocks: list[np.ndarray]) -> np.ndarray:
     )
 
 
-def part_one(input: str) -> int:
-    rocks = parse_input(input)
+def part_one(rocks: list[np.ndarray]) -> int:
     dim = get_cave_dimension(rocks)
     cave = create_cave(dim, rocks)
 
@@ -140,9 +150,8 @@ def part_one(input: str) -> int:
     return drops
 
 
-def part_two(input: str) -> int:
-    rocks = parse_input(input)
-    rocks.append(add_floor(rocks))
+def part_two(rocks: list[np.ndarray]) -> int:
+    rocks = rocks + [add_floor(rocks)]
     dim = get_cave_dimension(rocks)
     cave = create_cave(dim, rocks)
 
@@ -165,9 +174,10 @@ def main(p: int, s: bool) -> int:
     with open(file_path) as file:
         input = file.read()
 
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
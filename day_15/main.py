@@ -1,14 +1,9 @@
 import sys
 from dataclasses import dataclass
-from enum import Enum, auto
 from typing import Optional
 
-import tqdm
-
-
-class Input(Enum):
-    PART_ONE = auto()
-    PART_TWO = auto()
+from aoc22 import instrument
+from aoc22.deps import progress
 
 
 @dataclass
@@ -32,17 +27,12 @@ class Sensor:
         return abs(self.x - self.beacon.x) + abs(self.y - self.beacon.y)
 
 
-def input_path(input: Input, sample: bool) -> str:
-    file_path = {
-        Input.PART_ONE: {False: "input_1.txt", True: "sample_1.txt"},
-        Input.PART_TWO: {False: "input_2.txt", True: "sample_2.txt"},
-    }
-    return file_path[input][sample]
+def target_row(sample: bool) -> int:
+    return 10 if sample else 2000000
 
 
-def get_input(input: Input, sample: bool) -> list[str]:
-    with open(input_path(input, sample), "r") as file:
-        return [l.strip() for l in file.readlines()]
+def max_coordinate(sample: bool) -> int:
+    return 20 if sample else 4000000
 
 
 def get_sensor(line: str) -> Sensor:
@@ -118,18 +108,20 @@ def get_row_range(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
     return merged_ranges
 
 
-def part_one(row: int, sample: bool) -> int:
-    input_lines = get_input(input=Input.PART_ONE, sample=sample)
-    sensors = [get_sensor(l) for l in input_lines]
+def parse_input(input: str) -> list[Sensor]:
+    return [get_sensor(l.strip()) for l in input.splitlines()]
+
+
+def part_one(sensors: list[Sensor], sample: bool = False) -> int:
+    row = target_row(sample)
     cells = get_row(row, sensors, -sys.maxsize, sys.maxsize)
     objects = get_objects_in_row(row, sensors)
     return len(cells - objects)
 
 
-def part_two(sample: bool, max_coord: int) -> int:
-    input_lines = get_input(input=Input.PART_TWO, sample=sample)
-    sensors = [get_sensor(l) for l in input_lines]
-    for row in tqdm.tqdm(range(max_coord + 1)):
+def part_two(sensors: list[Sensor], sample: bool = False) -> int:
+    max_coord = max_coordinate(sample)
+    for row in progress(range(max_coord + 1)):
         sensor_ranges = []
         sensors_in_reach = [s for s in sensors if in_reach(row, s)]
         for s in sensors_in_reach:
@@ -140,16 +132,26 @@ def part_two(sample: bool, max_coord: int) -> int:
             sensor_ranges.append((min_x, max_x))
         row_range = get_row_range(sensor_ranges)
         if row_range != [(0, max_coord)]:
+            instrument.count("day_15.rows_scanned", row + 1)
             return (row_range[0][1] + 1) * 4000000 + row
 
+    instrument.count("day_15.rows_scanned", max_coord + 1)
     return -1
 
 
-def main():
-    # solution = part_one(row=2000000, sample=False)
-    solution = part_two(sample=True, max_coord=20)
-    print(solution)  # 11756174628223
+def main(p: int, s: bool) -> int:
+    file_name = "sample" if s else "input"
+    file_version = f"_{p}.txt"
+    file_path = file_name + file_version
+    with open(file_path) as file:
+        input = file.read()
+
+    data = parse_input(input)
+    if p == 1:
+        return part_one(data, sample=s)
+    return part_two(data, sample=s)
 
 
 if __name__ == "__main__":
-    main()
+    result = main(p=2, s=True)
+    print(result)  # 11756174628223
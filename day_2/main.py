@@ -1,5 +1,19 @@
+from __future__ import annotations
+
+from collections import Counter
 from dataclasses import dataclass
 from enum import StrEnum, auto
+from pathlib import Path
+from typing import Callable, Iterable
+
+from aoc22.deps import lazy_import
+from aoc22.inputs import mapped
+
+np = lazy_import("numpy")
+
+LINES = [f'{e} {h}' for e in 'ABC' for h in 'XYZ']
+RECORD = len('A X\n')
+BLOCK = 2**22 * RECORD
 
 
 class RPS(StrEnum):
@@ -123,18 +137,63 @@ class Game:
 
 
 
-def part_one(input: str) -> int:
-    rounds = [r.split(' ') for r in input.splitlines()]
-    games = [Game(Hands(Hand(e), Hand(h))) for e, h in rounds]
-    scores = [g.score for g in games]
-    
-    return sum(scores)
+def hand_score(elf: str, human: str) -> int:
+    return Game(Hands(Hand(elf), Hand(human))).score
+
+def strategy_score(elf: str, outcome: str) -> int:
+    return Game(Strategy([elf, outcome]).hands).score
+
+def line_scores(score: Callable[[str, str], int]) -> dict[str, int]:
+    return {line: score(*line.split(' ')) for line in LINES}
+
+PART_ONE_SCORES = line_scores(hand_score)
+PART_TWO_SCORES = line_scores(strategy_score)
+
+def total_score(counts: Counter[str], scores: dict[str, int]) -> int:
+    return sum(scores[line] * n for line, n in counts.items())
 
-def part_two(input: str) -> int:
-    rounds = [r.split(' ') for r in input.splitlines()]
-    games = [Game(Strategy(r).hands) for r in rounds]
-    scores = [g.score for g in games]
-    return sum(scores)
+def parse_input(input: str) -> Counter[str]:
+    return Counter(input.splitlines())
+
+def parse_lines(lines: Iterable[str]) -> Counter[str]:
+    return Counter(line.rstrip() for line in lines)
+
+def valid_block(block: np.ndarray, elf: np.ndarray, human: np.ndarray) -> bool:
+    return bool(
+        ((elf >= 0) & (elf <= 2)).all()
+        and ((human >= 0) & (human <= 2)).all()
+        and (block[1::RECORD] == ord(' ')).all()
+        and (block[3::RECORD] == ord('\n')).all()
+    )
+
+def line_counts(data: np.ndarray) -> tuple[np.ndarray, bool]:
+    """Count each of the nine lines, and report whether every record was well formed."""
+    counts = np.zeros(len(LINES), dtype=np.int64)
+    for start in range(0, len(data), BLOCK):
+        block = data[start:start + BLOCK]
+        elf = block[0::RECORD].astype(np.int16) - ord('A')
+        human = block[2::RECORD].astype(np.int16) - ord('X')
+        if not valid_block(block, elf, human):
+            return counts, False
+        counts += np.bincount(elf * 3 + human, minlength=len(LINES))
+    return counts, True
+
+def parse_numpy(path: Path) -> Counter[str]:
+    with mapped(path) as buffer:
+        valid = len(buffer) % RECORD in (0, RECORD - 1)
+        if valid:
+            counts, valid = line_counts(np.frombuffer(buffer, dtype=np.uint8))
+    if not valid:
+        raise ValueError('expected fixed-width "A X" lines')
+    return Counter({line: int(n) for line, n in zip(LINES, counts) if n})
+
+BACKENDS = {'numpy': parse_numpy}
+
+def part_one(counts: Counter[str]) -> int:
+    return total_score(counts, PART_ONE_SCORES)
+
+def part_two(counts: Counter[str]) -> int:
+    return total_score(counts, PART_TWO_SCORES)
 
 
 def main(p: int, s: bool) -> int:
@@ -143,10 +202,11 @@ def main(p: int, s: bool) -> int:
     file_path = file_name + file_version
     with open(file_path) as file:
         input = file.read()
-    
+
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
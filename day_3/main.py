@@ -1,50 +1,155 @@
+from __future__ import annotations
 
+from dataclasses import dataclass
+from pathlib import Path
+from string import ascii_letters
+from typing import Iterator, Optional
+
+from aoc22.deps import lazy_import
+from aoc22.inputs import mapped
+
+np = lazy_import("numpy")
+
+BLOCK = 2**20
+ITEMS = len(ascii_letters)
 
 ItemType = str
-Compartment = list[ItemType]
+Compartment = int
 Rucksack = tuple[Compartment, Compartment]
 Group = tuple[Rucksack, Rucksack, Rucksack]
 
 
+def str_to_int(item_type: ItemType) -> int:
+    if item_type.isupper():
+        return ord(item_type) - 38
+    return ord(item_type) - 96
+
+
+ITEM_BITS: dict[ItemType, int] = {i: 1 << str_to_int(i) for i in ascii_letters}
+
+
+def get_compartment(items: str) -> Compartment:
+    return sum(ITEM_BITS[i] for i in set(items))
+
+
 def get_rucksacks(input: str) -> list[Rucksack]:
     input_lines = input.splitlines()
-    items = [list(row) for row in input_lines]
-    rucksacks = [(r[:len(r)//2], r[len(r)//2:]) for r in items]
+    rucksacks = [
+        (get_compartment(r[:len(r)//2]), get_compartment(r[len(r)//2:]))
+        for r in input_lines
+    ]
     return rucksacks
 
 
-def get_commons(rucksack: Rucksack) -> set[ItemType]:
+def get_commons(rucksack: Rucksack) -> Compartment:
     a, b = rucksack
-    c = {i for i in a if i in b}
-    return c
+    return a & b
 
-def str_to_int(item_type: ItemType) -> int:
-    if item_type.isupper():
-        return ord(item_type) - 38
-    return ord(item_type) - 96
 
-
-def get_priority(common_items: set[ItemType]) -> int:
-    return sum([str_to_int(i) for i in common_items])
+def get_priority(common_items: Compartment) -> int:
+    priority = 0
+    while common_items:
+        lowest = common_items & -common_items
+        priority += lowest.bit_length() - 1
+        common_items ^= lowest
+    return priority
 
 
 def get_groups(rucksacks: list[Rucksack]) -> list[Group]:
     return [tuple(rucksacks[i:i+3]) for i in range(0, len(rucksacks), 3)]
 
-def get_badge(group: Group) -> set[ItemType]:
-    a, b, c = [set(r[0] + r[1]) for r in group]
-    return a.intersection(b, c)
+def get_badge(group: Group) -> Compartment:
+    a, b, c = [r[0] | r[1] for r in group]
+    return a & b & c
+
 
+@dataclass
+class Presence:
+    """Rucksacks x 52 matrices of which items each compartment holds."""
 
-def part_one(input: str) -> int:
-    r = get_rucksacks(input)
+    first: np.ndarray
+    second: np.ndarray
+
+    def common_priority(self) -> int:
+        commons = self.first & self.second
+        return int(commons.nonzero()[1].sum()) + int(commons.sum())
+
+    def badge_priority(self) -> int:
+        groups = (self.first | self.second).reshape(-1, 3, ITEMS)
+        badges = groups.all(axis=1)
+        return int(badges.nonzero()[1].sum()) + int(badges.sum())
+
+
+def priority_table() -> np.ndarray:
+    table = np.full(256, -1, dtype=np.int8)
+    for item in ascii_letters:
+        table[ord(item)] = str_to_int(item) - 1
+    return table
+
+
+def line_blocks(buffer: bytes, size: int = BLOCK) -> Iterator[tuple[int, int]]:
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b'\n', start + size) + 1 or len(buffer)
+        yield start, end
+        start = end
+
+
+def block_presence(
+    buffer: bytes, start: int, end: int, table: np.ndarray
+) -> Optional[np.ndarray]:
+    """Mark the items of a block of lines, or return None if it holds a non-letter."""
+    data = np.frombuffer(buffer, np.uint8, count=end - start, offset=start)
+    newline = data == ord('\n')
+    if not ((table[data] >= 0) | newline).all():
+        return None
+    ends = np.flatnonzero(newline)
+    if len(data) and not newline[-1]:
+        ends = np.append(ends, len(data))
+    lengths = ends - np.concatenate(([-1], ends[:-1])) - 1
+
+    rucksack = np.repeat(np.arange(len(ends)), lengths)
+    firsts = np.cumsum(lengths) - lengths
+    offset = np.arange(len(rucksack)) - np.repeat(firsts, lengths)
+    second = offset >= np.repeat(lengths // 2, lengths)
+    items = table[data[~newline]]
+
+    presence = np.zeros((2, len(ends), ITEMS), dtype=bool)
+    presence[second.astype(np.intp), rucksack, items] = True
+    return presence
+
+
+def parse_numpy(path: Path) -> Presence:
+    table = priority_table()
+    blocks = [np.zeros((2, 0, ITEMS), dtype=bool)]
+    with mapped(path) as buffer:
+        for start, end in line_blocks(buffer):
+            block = block_presence(buffer, start, end, table)
+            if block is None:
+                raise ValueError('rucksack items must be ASCII letters')
+            blocks.append(block)
+    presence = np.concatenate(blocks, axis=1)
+    return Presence(presence[0], presence[1])
+
+
+BACKENDS = {'numpy': parse_numpy}
+
+
+def parse_input(input: str) -> list[Rucksack]:
+    return get_rucksacks(input)
+
+
+def part_one(r: list[Rucksack] | Presence) -> int:
+    if isinstance(r, Presence):
+        return r.common_priority()
     c = [get_commons(i) for i in r]
     p = [get_priority(i) for i in c]
     return sum(p)
 
 
-def part_two(input: str) -> int:
-    r = get_rucksacks(input)
+def part_two(r: list[Rucksack] | Presence) -> int:
+    if isinstance(r, Presence):
+        return r.badge_priority()
     g = get_groups(r)
     b = [get_badge(i) for i in g]
     p = [get_priority(i) for i in b]
@@ -57,10 +162,11 @@ def main(p: int, s: bool) -> int:
     file_path = file_name + file_version
     with open(file_path) as file:
         input = file.read()
-    
+
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
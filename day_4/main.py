@@ -1,6 +1,16 @@
+from __future__ import annotations
 
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import Counter
 from dataclasses import dataclass
-from typing import Self
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Self
+
+from aoc22.deps import lazy_import
+from aoc22.inputs import mapped
+
+np = lazy_import("numpy")
 
 
 @dataclass
@@ -40,20 +50,141 @@ class Pair:
         return False
 
 
+class SectionIndex:
+    """Cross-pair queries over every elf's assignment, built with one sort."""
+
+    def __init__(self, ranges: list[Range]) -> None:
+        self.bounds = [(r.min, r.max) for r in ranges]
+        self.starts = sorted(lo for lo, _ in self.bounds)
+        self.ends = sorted(hi for _, hi in self.bounds)
+
+    def coverage(self, section: int) -> int:
+        """Count the assignments that include ``section``."""
+        started = bisect_right(self.starts, section)
+        return started - bisect_left(self.ends, section)
+
+    def busiest(self) -> tuple[int, list[tuple[int, int]]]:
+        """Return the deepest overlap and the section spans that reach it."""
+        deltas: Counter[int] = Counter()
+        for lo, hi in self.bounds:
+            deltas[lo] += 1
+            deltas[hi + 1] -= 1
+        positions = sorted(deltas)
+
+        depth = most = 0
+        spans: list[tuple[int, int]] = []
+        for section, following in zip(positions, positions[1:]):
+            depth += deltas[section]
+            if depth > most:
+                most, spans = depth, []
+            if depth == most and depth:
+                if spans and spans[-1][1] == section - 1:
+                    spans[-1] = (spans[-1][0], following - 1)
+                else:
+                    spans.append((section, following - 1))
+        return most, spans
+
+    def overlapping(self) -> Iterator[tuple[int, int]]:
+        """Yield every pair of elves, by index, whose assignments share a section."""
+        order = sorted(range(len(self.bounds)), key=self.bounds.__getitem__)
+        active: list[tuple[int, int]] = []
+        for elf in order:
+            lo, hi = self.bounds[elf]
+            while active and active[0][0] < lo:
+                heapq.heappop(active)
+            for _, other in active:
+                yield min(elf, other), max(elf, other)
+            heapq.heappush(active, (hi, elf))
+
+
+@dataclass
+class Sections:
+    """Pairs as an N x 4 array of first min, first max, second min, second max."""
+
+    bounds: np.ndarray
+
+    def contains(self) -> np.ndarray:
+        a, b, c, d = self.bounds.T
+        return ((a >= c) & (b <= d)) | ((c >= a) & (d <= b))
+
+    def overlaps(self) -> np.ndarray:
+        a, b, c, d = self.bounds.T
+        return (a <= d) & (c <= b)
+
+
+SEPARATORS = b'-,-\n'
+
+
+def valid_layout(data: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> bool:
+    """Check that the numbers are separated by exactly '-', ',', '-' and a newline."""
+    if len(starts) % len(SEPARATORS) or not len(starts):
+        return not len(data)
+    tail = data[ends[-1]:]
+    if starts[0] != 0 or not (len(tail) == 0 or tail.tobytes() == b'\n'):
+        return False
+    separators = np.frombuffer(SEPARATORS, dtype=np.uint8)
+    expected = np.resize(separators, len(starts) - 1)
+    return bool(
+        (starts[1:] - ends[:-1] == 1).all() and (data[ends[:-1]] == expected).all()
+    )
+
+
+def section_numbers(data: np.ndarray) -> Optional[np.ndarray]:
+    """Read every section number, or return None if the lines are malformed."""
+    digit = (data >= ord('0')) & (data <= ord('9'))
+    edges = np.diff(digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not valid_layout(data, starts, ends):
+        return None
+    lengths = ends - starts
+
+    values = np.zeros(len(ends), dtype=np.int32)
+    for place in range(int(lengths.max(initial=0))):
+        live = lengths > place
+        digits = data[ends[live] - 1 - place].astype(np.int32) - ord('0')
+        values[live] += digits * 10**place
+    return values
+
+
+def parse_numpy(path: Path) -> Sections:
+    with mapped(path) as buffer:
+        values = section_numbers(np.frombuffer(buffer, dtype=np.uint8))
+    if values is None:
+        raise ValueError('expected lines of the form "a-b,c-d"')
+    return Sections(values.reshape(-1, 4))
+
+
+BACKENDS = {'numpy': parse_numpy}
+
+
+def get_elves(pairs: list[Pair]) -> list[Range]:
+    return [r for p in pairs for r in (p.first, p.second)]
+
+
 def get_pairs(input: str) -> list[Pair]:
-    lines = input.splitlines()
+    return parse_lines(input.splitlines())
+
+
+def parse_input(input: str) -> list[Pair]:
+    return get_pairs(input)
+
+
+def parse_lines(lines: Iterable[str]) -> list[Pair]:
     pairs = [l.split(',') for l in lines]
     return [Pair(Range(p[0]), Range(p[1])) for p in pairs]
     
 
-def part_one(input: str) -> int:
-    pairs = get_pairs(input)
+def part_one(pairs: list[Pair] | Sections) -> int:
+    if isinstance(pairs, Sections):
+        return int(pairs.contains().sum())
     intersects = [p.intersect() for p in pairs]
     return sum(intersects)
 
 
-def part_two(input: str) -> int:
-    pairs = get_pairs(input)
+def part_two(pairs: list[Pair] | Sections) -> int:
+    if isinstance(pairs, Sections):
+        return int(pairs.overlaps().sum())
     overlaps = [p.overlap() for p in pairs]
     return sum(overlaps)
 
@@ -64,10 +195,11 @@ def main(p: int, s: bool) -> int:
     file_path = file_name + file_version
     with open(file_path) as file:
         input = file.read()
-    
+
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
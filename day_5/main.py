@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from collections import deque
+from __future__ import annotations
+from dataclasses import dataclass, field
+from itertools import takewhile
+from typing import Iterable
 
 
 @dataclass
@@ -11,21 +13,24 @@ class Instruction:
 
 @dataclass
 class Stack:
-    _crates: list[str]
+    crates: list[str] = field(default_factory=list)
 
-    def __post_init__(self) -> None:
-        self.crates = deque(self._crates)
-    
     def put(self, crates: list[str]) -> None:
-        for crate in crates:
-            self.crates.append(crate)
+        self.crates.extend(crates)
+
+    def take(self, qty: int) -> list[str]:
+        split = len(self.crates) - qty
+        if split < 0:
+            raise IndexError(f'cannot take {qty} of {len(self.crates)} crates')
+        crates = self.crates[split:]
+        del self.crates[split:]
+        return crates
     
     def get(self, qty: int) -> list[str]:
-        return [self.crates.pop() for _ in range(qty)] 
+        return self.take(qty)[::-1]
 
     def get_mult(self, qty: int) -> list[str]:
-        crates = self.get(qty)
-        return crates[::-1]
+        return self.take(qty)
 
     @property
     def top(self) -> str:
@@ -39,25 +44,23 @@ class Stack:
 class Ship:
     stacks: dict[int, Stack] 
 
-    def execute(self, instruction: Instruction) -> None:
-        src = instruction.src
-        dst = instruction.dst
-        qty = instruction.qty
-
-        crates = self.stacks[src].get(qty)
+    def move(self, qty: int, src: int, dst: int, keep_order: bool = False) -> None:
+        source = self.stacks[src]
+        crates = source.get_mult(qty) if keep_order else source.get(qty)
         self.stacks[dst].put(crates)
 
-    def execute_9001(self, instruction: Instruction) -> None:
-        src = instruction.src
-        dst = instruction.dst
-        qty = instruction.qty
+    def execute(self, instruction: Instruction) -> None:
+        self.move(instruction.qty, instruction.src, instruction.dst)
 
-        crates = self.stacks[src].get_mult(qty)
-        self.stacks[dst].put(crates)
+    def execute_9001(self, instruction: Instruction) -> None:
+        self.move(instruction.qty, instruction.src, instruction.dst, keep_order=True)
 
     @property
     def top_stacks(self) -> list[str]:
-        return [s.top for s in self.stacks.values()]
+        return [s.top for s in self.stacks.values() if s.crates]
+
+    def copy(self) -> Ship:
+        return Ship({i: Stack(list(s.crates)) for i, s in self.stacks.items()})
 
     def __repr__(self) -> str:
         return str(self.stacks)
@@ -67,50 +70,124 @@ def parse_level(level: str) -> list[str]:
     return [''.join(level[i:i+4]).strip() for i in range(0, len(level), 4)]
 
 
-def parse_input(input: str):
-    rows = [l for l in input.splitlines()]
+def parse_move(row: str) -> list[int]:
+    return [int(i) for i in row.split(' ') if i.isdigit()]
 
+
+def parse_drawing(rows: Iterable[str]) -> Ship:
     levels  = []
-    instructions = []
     stack_qty = 0
     for r in rows:
         if r.find('[') >= 0:
             levels.append(parse_level(r))
-        if r.find('m') == 0:
-            words = r.split(' ')
-            values = [int(i) for i in words if i.isdigit()]
-            instructions.append(Instruction(*values))
         if r.find(' 1') == 0:
-            stack_qty = int(r[-2])
+            stack_qty = int(r.split()[-1])
 
-    stacks = {i: Stack([]) for i in range(1, stack_qty + 1)}
-    for level in levels:
+    stacks = {i: Stack() for i in range(1, stack_qty + 1)}
+    for level in reversed(levels):
         for i, s in enumerate(level, 1):
             if s == '':
                 continue
-            stacks[i].crates.appendleft(s)
+            stacks[i].crates.append(s)
+
+    return Ship(stacks)
 
-    return Ship(stacks), instructions
+
+def parse_input(input: str) -> tuple[Ship, list[Instruction]]:
+    rows = [l for l in input.splitlines()]
+    ship = parse_drawing(r for r in rows if r.find('m') != 0)
+    instructions = [Instruction(*parse_move(r)) for r in rows if r.find('m') == 0]
+    return ship, instructions
+
+
+@dataclass
+class Moved:
+    """The ship after every move, under each crane's rule."""
+
+    crane_9000: Ship
+    crane_9001: Ship
+
+
+def parse_lines(lines: Iterable[str]) -> Moved:
+    lines = iter(lines)
+    ship = parse_drawing(takewhile(lambda r: r.strip() != '', lines))
+    moved = Moved(ship, ship.copy())
+    for r in lines:
+        if r.find('m') != 0:
+            continue
+        qty, src, dst = parse_move(r)
+        moved.crane_9000.move(qty, src, dst)
+        moved.crane_9001.move(qty, src, dst, keep_order=True)
+    return moved
 
 
 def format_result(top_stacks: list[str]) -> str:
     return ''.join([c for c in ''.join(top_stacks) if c.isalpha()])
 
 
-def part_one(input: str) -> str:
-    ship, instructions = parse_input(input)
+def final_heights(ship: Ship, instructions: list[Instruction]) -> dict[int, int]:
+    heights = {i: len(s.crates) for i, s in ship.stacks.items()}
+    for i in instructions:
+        heights[i.src] -= i.qty
+        heights[i.dst] += i.qty
+    return heights
+
+
+def trace_tops(
+    ship: Ship, instructions: list[Instruction], keep_order: bool = False
+) -> list[str]:
+    """Find the final top crates by tracing their positions back through the moves.
+
+    A position is a stack and a depth below its top. Walking the moves
+    backwards maps each final top to where it started, without moving
+    any crates.
+    """
+    heights = final_heights(ship, instructions)
+    positions = [[i, 0] for i, h in heights.items() if h > 0]
+    for i in reversed(instructions):
+        for position in positions:
+            stack, depth = position
+            if i.src == i.dst:
+                # a stack moved onto itself only flips its top block under 9000
+                if stack == i.src and depth < i.qty and not keep_order:
+                    position[1] = i.qty - 1 - depth
+            elif stack == i.src:
+                position[1] = depth + i.qty
+            elif stack == i.dst and depth < i.qty:
+                position[0] = i.src
+                position[1] = depth if keep_order else i.qty - 1 - depth
+            elif stack == i.dst:
+                position[1] = depth - i.qty
+
+    return [ship.stacks[stack].crates[-1 - depth] for stack, depth in positions]
+
+
+def simulate_tops(
+    ship: Ship, instructions: list[Instruction], keep_order: bool = False
+) -> list[str]:
+    ship = ship.copy()
     for i in instructions:
-        ship.execute(i)
+        if keep_order:
+            ship.execute_9001(i)
+        else:
+            ship.execute(i)
+    return ship.top_stacks
 
-    return format_result(ship.top_stacks)
 
+def part_one(data: tuple[Ship, list[Instruction]] | Moved, trace: bool = True) -> str:
+    if isinstance(data, Moved):
+        return format_result(data.crane_9000.top_stacks)
+    ship, instructions = data
+    tops = trace_tops if trace else simulate_tops
+    return format_result(tops(ship, instructions))
 
-def part_two(input: str) -> str:
-    ship, instructions = parse_input(input)
-    for i in instructions:
-        ship.execute_9001(i)
 
-    return format_result(ship.top_stacks)
+def part_two(data: tuple[Ship, list[Instruction]] | Moved, trace: bool = True) -> str:
+    if isinstance(data, Moved):
+        return format_result(data.crane_9001.top_stacks)
+    ship, instructions = data
+    tops = trace_tops if trace else simulate_tops
+    return format_result(tops(ship, instructions, keep_order=True))
 
 
 def main(p: int, s: bool) -> str:
@@ -119,10 +196,11 @@ def main(p: int, s: bool) -> str:
     file_path = file_name + file_version
     with open(file_path) as file:
         input = file.read()
-    
+
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
@@ -1,23 +1,86 @@
+from dataclasses import dataclass
+from functools import partial
+from itertools import chain
+from pathlib import Path
+from typing import BinaryIO, Hashable, Iterable, Iterator, Optional
 
-def find_start_packet(input: str) -> int:
-    for i in range(len(input)):
-        chars = input[i:i+4]
-        if len(set(chars)) != 4:
-            continue
-        return i + 4
-
-def find_message(input: str) -> int:
-    for i in range(len(input)):
-        chars = input[i:i+14]
-        if len(set(chars)) != 14:
-            continue
-        return i + 14
-
-def part_one(input: str) -> int:
+START_PACKET = 4
+MESSAGE = 14
+CHUNK = 2**16
+
+
+def find_markers(stream: Iterable[Hashable], sizes: Iterable[int]) -> dict[int, int]:
+    """Find where each window size first holds only distinct symbols, in one pass.
+
+    Each symbol is looked at once: the window's left edge jumps past the
+    last position its newest symbol was seen at, so the window always
+    holds distinct symbols. Sizes that never occur are left out.
+    """
+    pending = sorted(set(sizes))
+    markers: dict[int, int] = {}
+    last_seen: dict[Hashable, int] = {}
+    left = 0
+    for i, symbol in enumerate(stream):
+        seen = last_seen.get(symbol, -1)
+        if seen >= left:
+            left = seen + 1
+        last_seen[symbol] = i
+
+        while pending and i - left + 1 >= pending[0]:
+            markers[pending.pop(0)] = i + 1
+        if not pending:
+            break
+    return markers
+
+
+def find_marker(stream: Iterable[Hashable], size: int) -> Optional[int]:
+    return find_markers(stream, [size]).get(size)
+
+def chunks(source: BinaryIO | Iterable[bytes], size: int = CHUNK) -> Iterator[bytes]:
+    if hasattr(source, 'read'):
+        return iter(partial(source.read, size), b'')
+    return iter(source)
+
+def find_stream_markers(
+    source: BinaryIO | Iterable[bytes], sizes: Iterable[int]
+) -> dict[int, int]:
+    """Find markers by absolute offset, reading chunks only until the last is found."""
+    return find_markers(chain.from_iterable(chunks(source)), sizes)
+
+def find_stream_marker(source: BinaryIO | Iterable[bytes], size: int) -> Optional[int]:
+    return find_stream_markers(source, [size]).get(size)
+
+def find_start_packet(input: str) -> Optional[int]:
+    return find_marker(input, START_PACKET)
+
+def find_message(input: str) -> Optional[int]:
+    return find_marker(input, MESSAGE)
+
+@dataclass
+class Datastream:
+    """A signal left on disk, read only as far as the marker a part needs."""
+
+    path: Path
+
+    def find_marker(self, size: int) -> Optional[int]:
+        with open(self.path, 'rb') as file:
+            return find_stream_marker(file, size)
+
+def parse_input(input: str) -> str:
+    return input
+
+def parse_file(path: Path) -> Datastream:
+    return Datastream(path)
+
+def part_one(input: str | Datastream) -> Optional[int]:
+    if isinstance(input, Datastream):
+        return input.find_marker(START_PACKET)
     start = find_start_packet(input)
     return start
 
-def part_two(input: str) -> int:
+def part_two(input: str | Datastream) -> Optional[int]:
+    if isinstance(input, Datastream):
+        return input.find_marker(MESSAGE)
     msg = find_message(input)
     return msg
 
@@ -28,10 +91,11 @@ def main(p: int, s: bool) -> int:
     file_path = file_name + file_version
     with open(file_path) as file:
         input = file.read()
-    
+
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
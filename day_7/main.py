@@ -1,7 +1,15 @@
 from __future__ import annotations
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from aoc22.inputs import lines
+
+TOTAL_SPACE = 70000000
+REQUIRED_SPACE = 30000000
+SMALL_DIR = 100000
 
 
 @dataclass
@@ -13,47 +21,74 @@ class File:
         return hash(self.name)
 
 
-@dataclass
+@dataclass(eq=False)
 class Dir:
     name: Optional[str] 
     parent: Optional[Dir] = None
-    directories: set[Dir] = field(default_factory=set)
-    files: set[File] = field(default_factory=set)
+    directories: dict[str, Dir] = field(default_factory=dict)
+    files: dict[str, File] = field(default_factory=dict)
+    _path_hash: int = field(default=hash('/'), repr=False)
+    _size: int = field(default=0, repr=False)
 
     @property
     def size(self) -> int:
-        return self._dir_sizes + self._file_sizes
+        """Subtree size as of the last ``index_sizes``, which parse_input runs."""
+        return self._size
+
+    @property
+    def path(self) -> str:
+        names = []
+        d = self
+        while d.parent:
+            names.append(f'{d.name}/')
+            d = d.parent
+        return '/' + ''.join(reversed(names))
 
     @property
     def _file_sizes(self) -> int:
-        return sum([f.size for f in self.files])
+        return sum([f.size for f in self.files.values()])
 
     @property
     def _dir_sizes(self) -> int:
-        return sum([d.size for d in self.directories])
+        return sum([d.size for d in self.directories.values()])
 
-    def get_all_dirs(self, dirs: list[Dir]):
+    def add_file(self, file: File) -> None:
+        self.files[file.name] = file
 
-        dirs.append(self)
+    def add_dir(self, directory: Dir) -> None:
+        directory.parent = self
+        directory._path_hash = hash((self._path_hash, directory.name))
+        self.directories[directory.name] = directory
 
-        if len(self.directories) == 0:
-            return dirs
+    def index_sizes(self) -> None:
+        """Recompute every size in this subtree, children before their parents."""
+        for d in reversed(self.get_all_dirs([])):
+            d._size = d._file_sizes + d._dir_sizes
 
-        for d in self.directories:
-            d.get_all_dirs(dirs)
-            
+    def get_all_dirs(self, dirs: list[Dir]):
+        stack = [self]
+        while stack:
+            d = stack.pop()
+            dirs.append(d)
+            stack.extend(d.directories.values())
         return dirs
 
     def print(self, level=0) -> None:
-        new_level = level + 1
-        print('\t' * new_level,f'- DIR {self.name} ({self.size})')
-        for file in self.files:
-            print('\t' * (new_level + 1), f'- {file.name} ({file.size})')
-        for d in self.directories:
-            d.print(new_level)
+        stack = [(self, level + 1)]
+        while stack:
+            d, new_level = stack.pop()
+            print('\t' * new_level,f'- DIR {d.name} ({d.size})')
+            for file in d.files.values():
+                print('\t' * (new_level + 1), f'- {file.name} ({file.size})')
+            stack.extend((c, new_level + 1) for c in reversed(d.directories.values()))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Dir) or hash(self) != hash(other):
+            return False
+        return self is other or self.path == other.path
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self._path_hash
 
 
 
@@ -97,7 +132,7 @@ def parse_cd(line: str, cwd: Dir, root: Dir) -> Dir:
         assert cwd.parent
         return cwd.parent
     if target != '/':
-        return [d for d in cwd.directories if d.name == target][0]
+        return cwd.directories[target]
     return root
 
 def parse_line(line: str, root: Dir, cwd: Dir) -> Dir:
@@ -112,14 +147,14 @@ def parse_line(line: str, root: Dir, cwd: Dir) -> Dir:
 
     if line_type == LineType.DIR:
         dir_name = parse_ls(line, line_type)
-        if dir_name not in [d.name for d in cwd.directories]:
-            cwd.directories.add(Dir(dir_name, parent=cwd))
+        if dir_name not in cwd.directories:
+            cwd.add_dir(Dir(dir_name))
         return cwd
 
     if line_type == LineType.FILE:
         sz, name = line.split(' ')
-        if name not in [f.name for f in cwd.files]:
-            cwd.files.add(File(name, int(sz)))
+        if name not in cwd.files:
+            cwd.add_file(File(name, int(sz)))
         return cwd
 
     raise NotImplemented
@@ -133,32 +168,124 @@ def parse_input(input: str) -> Dir:
     for line in input.splitlines()[1:]:
         cwd = parse_line(line, root, cwd)
 
+    root.index_sizes()
     return root
 
 
-def part_one(input: str) -> int:
-    root = parse_input(input)
+@dataclass
+class Columns:
+    """A filesystem as parallel arrays, in which every node comes after its parent.
+
+    Names are interned into one buffer of newline-terminated names, and
+    each node points at its name by offset. The root is node 0.
+    """
+
+    parent: array = field(default_factory=lambda: array('q'))
+    size: array = field(default_factory=lambda: array('q'))
+    is_dir: bytearray = field(default_factory=bytearray)
+    name_offset: array = field(default_factory=lambda: array('q'))
+    names: bytearray = field(default_factory=bytearray)
+
+    def add(self, name_offset: int, parent: int, size: int, is_dir: bool) -> int:
+        self.parent.append(parent)
+        self.size.append(size)
+        self.is_dir.append(is_dir)
+        self.name_offset.append(name_offset)
+        return len(self.parent) - 1
+
+    def name(self, node: int) -> str:
+        start = self.name_offset[node]
+        return self.names[start:self.names.index(b'\n', start)].decode()
+
+    def accumulate(self) -> None:
+        """Turn directory sizes into subtree sizes, visiting children before parents."""
+        size, parent = self.size, self.parent
+        for node in range(len(parent) - 1, 0, -1):
+            size[parent[node]] += size[node]
+
+    def dir_sizes(self) -> Iterator[int]:
+        return (s for s, d in zip(self.size, self.is_dir) if d)
+
+
+def parse_columns(log: Iterable[str]) -> Columns:
+    tree = Columns()
+    interned: dict[str, int] = {}
+
+    def intern(name: str) -> int:
+        if name not in interned:
+            interned[name] = len(tree.names)
+            tree.names += name.encode() + b'\n'
+        return interned[name]
+
+    root = tree.add(intern('/'), -1, 0, True)
+    subdirs: dict[tuple[int, str], int] = {}
+    listed = bytearray(1)
+    cwd = root
+    skipping = False
+    for line in log:
+        if line.startswith('$ cd '):
+            target = line[5:].rstrip()
+            if target == '/':
+                cwd = root
+            elif target == '..':
+                if cwd == root:
+                    raise ValueError('cannot cd .. above /')
+                cwd = tree.parent[cwd]
+            elif (cwd, target) in subdirs:
+                cwd = subdirs[cwd, target]
+            else:
+                raise ValueError(f'no directory {target!r} in {tree.name(cwd)!r}')
+        elif line.startswith('$ ls'):
+            # a directory listed again has no new entries
+            skipping = bool(listed[cwd])
+            listed[cwd] = True
+        elif skipping:
+            continue
+        elif line.startswith('dir '):
+            name = line[4:].rstrip()
+            subdirs[cwd, name] = tree.add(intern(name), cwd, 0, True)
+            listed.append(False)
+        elif line.strip():
+            size, name = line.split()
+            tree.add(intern(name), cwd, int(size), False)
+            listed.append(False)
+
+    tree.accumulate()
+    return tree
+
+
+def parse_columnar(path: Path) -> Columns:
+    return parse_columns(lines(path))
+
+
+BACKENDS = {'columnar': parse_columnar}
+
+
+def part_one(root: Dir | Columns) -> int:
     """ root.print() """
+    if isinstance(root, Columns):
+        return sum(s for s in root.dir_sizes() if s <= SMALL_DIR)
     dirs = root.get_all_dirs([])
 
-    small_dirs = [d for d in dirs if d.size <= 100000]
+    small_dirs = [d for d in dirs if d.size <= SMALL_DIR]
     for sd in small_dirs:
         print(sd.name, sd.size)
     
     return sum([d.size for d in small_dirs])
 
 
-def part_two(input: str) -> int:
-    root = parse_input(input)
+def part_two(root: Dir | Columns) -> int:
     """ root.print() """
     """ dirs = root.get_all_dirs([]) """
 
-    total = 70000000
-    required = 30000000
-    current = root.size
+    total = TOTAL_SPACE
+    required = REQUIRED_SPACE
+    current = root.size[0] if isinstance(root, Columns) else root.size
     free = total - current
     missing = abs(free - required)
 
+    if isinstance(root, Columns):
+        return min(s for s in root.dir_sizes() if s >= missing)
     dirs = root.get_all_dirs([])
     sizes = [d.size for d in dirs if d.size >= missing]
 
@@ -172,9 +299,10 @@ def main(p: int, s: bool) -> int:
     with open(file_path) as file:
         input = file.read()
 
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
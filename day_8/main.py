@@ -1,4 +1,8 @@
-import numpy as np
+from __future__ import annotations
+
+from aoc22.deps import lazy_import
+
+np = lazy_import("numpy")
 
 
 def parse_input(input: str) -> np.ndarray:
@@ -32,8 +36,7 @@ def visible_trees(los: list[np.ndarray], height: int) -> int:
     return np.multiply.reduce(np.array(visible_dist))
 
 
-def part_one(input: str) -> int:
-    trees = parse_input(input)
+def part_one(trees: np.ndarray) -> int:
     visible = create_visible_mask(trees)
     for y, row in enumerate(trees[1:-1, 1:-1], 1):
         for x, tree in enumerate(row, 1):
@@ -45,8 +48,7 @@ def part_one(input: str) -> int:
     return visible.sum()
 
 
-def part_two(input: str) -> int:
-    trees = parse_input(input)
+def part_two(trees: np.ndarray) -> int:
     scenic = np.zeros_like(trees)
     for y, x in np.ndindex(trees.shape):
         if y == 0 or y == len(trees) - 1:
@@ -74,9 +76,10 @@ def main(p: int, s: bool) -> int:
     with open(file_path) as file:
         input = file.read()
 
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":
@@ -19,10 +19,6 @@ class Movement:
             return (0, 1)
         raise NotImplemented
 
-    def take(self) -> tuple[int, int]:
-        self.distance -= 1
-        return self.vector
-
 
 @dataclass
 class Vector:
@@ -76,8 +72,7 @@ def parse_input(input: str) -> list[Movement]:
     return [Movement(d, int(n)) for d, n in movements]
 
 
-def part_one(input: str) -> int:
-    movements = parse_input(input)
+def part_one(movements: list[Movement]) -> int:
 
     head = Vector(0, 0)
     tail = Vector(0, 0)
@@ -85,8 +80,8 @@ def part_one(input: str) -> int:
     positions: set[tuple[int, int]] = {tail.loc}
 
     for movement in movements:
-        while movement.distance > 0:
-            order = movement.take()
+        order = movement.vector
+        for _ in range(movement.distance):
             head.move(order)
             if head.adjacent(tail):
                 continue
@@ -96,8 +91,7 @@ def part_one(input: str) -> int:
     return len(positions)
 
 
-def part_two(input: str) -> int:
-    movements = parse_input(input)
+def part_two(movements: list[Movement]) -> int:
 
     head = Vector(0, 0)
     t1 = Vector(0, 0)
@@ -113,8 +107,8 @@ def part_two(input: str) -> int:
     positions: set[tuple[int, int]] = {t9.loc}
 
     for movement in movements:
-        while movement.distance > 0:
-            order = movement.take()
+        order = movement.vector
+        for _ in range(movement.distance):
             head.move(order)
 
             if not t1.adjacent(head):
@@ -155,9 +149,10 @@ def main(p: int, s: bool) -> int:
     with open(file_path) as file:
         input = file.read()
 
+    data = parse_input(input)
     if p == 1:
-        return part_one(input)
-    return part_two(input)
+        return part_one(data)
+    return part_two(data)
 
 
 if __name__ == "__main__":